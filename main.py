@@ -19,6 +19,17 @@ from strategy import MarketMaker, MarketMakerConfig
 # Load credentials from .env (if used)
 # load_dotenv()
 
+# SPOT/LINEAR
+PRODUCT_TYPE = BybitProductType.LINEAR
+BTCUSDT = InstrumentId.from_str(f"BTCUSDT-{PRODUCT_TYPE.value.upper()}.BYBIT")
+INSTRUMENT_IDS = (BTCUSDT,)
+
+# Strategy parameters (sizes and thresholds in each instrument's base units)
+TRADE_SIZE = {BTCUSDT: Decimal("0.01")}
+INVENTORY_THRESHOLD = {BTCUSDT: Decimal("5.0")}
+SPREAD_PCT = Decimal("0.001")  # 0.1% total spread
+QUOTE_INTERVAL_SECONDS = 5
+
 async def main():
     """
     Run the strategy connected only to Bybit for data and execution.
@@ -26,9 +37,9 @@ async def main():
     # *** THIS IS A TEST STRATEGY WITH NO ALPHA ADVANTAGE WHATSOEVER. ***
     # *** IT IS NOT INTENDED TO BE USED TO TRADE LIVE WITH REAL MONEY. ***
 
-    # SPOT/LINEAR
-    product_type = BybitProductType.LINEAR
-    symbol = f"BTCUSDT-{product_type.value.upper()}"
+    # Only load the instruments we trade (not the whole Bybit universe),
+    # shared by the data and execution clients
+    instrument_provider = InstrumentProviderConfig(load_ids=frozenset(INSTRUMENT_IDS))
 
     # Configure the trading node
     config_node = TradingNodeConfig(
@@ -43,8 +54,8 @@ async def main():
                 api_key='',  # 'BYBIT_API_KEY' env var
                 api_secret='',  # 'BYBIT_API_SECRET' env var
                 base_url_http=None,  # Override with custom endpoint
-                instrument_provider=InstrumentProviderConfig(load_all=True),
-                product_types=[product_type],
+                instrument_provider=instrument_provider,
+                product_types=[PRODUCT_TYPE],
                 testnet=True,  # If client uses the testnet
             ),
         },
@@ -54,8 +65,8 @@ async def main():
                 api_secret='',  # 'BYBIT_API_SECRET' env var
                 base_url_http=None,  # Override with custom endpoint
                 # base_url_ws_private=None,  # Override with custom endpoint
-                instrument_provider=InstrumentProviderConfig(load_all=True),
-                product_types=[product_type],
+                instrument_provider=instrument_provider,
+                product_types=[PRODUCT_TYPE],
                 testnet=True,  # If client uses the testnet
                 max_retries=3,
             ),
@@ -73,11 +84,14 @@ async def main():
 
     # Configure the strategy
     strat_config = MarketMakerConfig(
-        instrument_id=InstrumentId.from_str(f"{symbol}.BYBIT"),
-        trade_size=Decimal("0.01"),
-        spread_pct=Decimal("0.001"),  # 1% total spread
-        inventory_threshold=Decimal("5.0"),
-        quote_interval_seconds=5,
+        instrument_ids=INSTRUMENT_IDS,
+        trade_size=TRADE_SIZE,
+        inventory_threshold=INVENTORY_THRESHOLD,
+        spread_pct=SPREAD_PCT,
+        quote_interval_seconds=QUOTE_INTERVAL_SECONDS,
+        # Claim orders/positions found at startup so existing inventory
+        # is attributed to this strategy (instead of EXTERNAL) and drives the skew
+        external_order_claims=list(INSTRUMENT_IDS),
     )
     
     # Instantiate and add the strategy
@@ -99,5 +113,14 @@ async def main():
         node.dispose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (installed with nautilus_trader on Linux/macOS) speeds up the
+    # socket I/O behind every websocket update and order request
+    try:
+        import uvloop
+    except ImportError:  # e.g. Windows
+        run = asyncio.run
+    else:
+        run = uvloop.run
+
+    run(main())
 
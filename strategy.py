@@ -9,17 +9,28 @@ Author: [Your Name]
 YouTube: [Your Channel]
 """
 
+import math
 from decimal import Decimal
 from datetime import timedelta
 
 from nautilus_trader.config import StrategyConfig
 from nautilus_trader.model.book import OrderBook
-from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events import OrderCanceled
+from nautilus_trader.model.events import OrderDenied
+from nautilus_trader.model.events import OrderExpired
+from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.model.events import OrderModifyRejected
+from nautilus_trader.model.events import OrderRejected
+from nautilus_trader.model.events import PositionChanged
+from nautilus_trader.model.events import PositionClosed
+from nautilus_trader.model.events import PositionOpened
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orders import LimitOrder
 from nautilus_trader.trading.strategy import Strategy
 
 
@@ -33,36 +44,47 @@ class MarketMakerConfig(StrategyConfig, frozen=True):
 
     Parameters
     ----------
-    instrument_id : InstrumentId
-        The instrument to trade (e.g., "BTC-USD.COINBASE")
-    trade_size : Decimal
-        Size of each order (e.g., Decimal("0.1") for 0.1 BTC)
+    instrument_ids : tuple[InstrumentId, ...]
+        The instruments to trade (e.g., ("BTC-USD.COINBASE", "ETH-USD.COINBASE"))
+        All of them are quoted by this one strategy on a shared timer
+    trade_size : dict[InstrumentId, Decimal]
+        Size of each order per instrument, in its base units
+        (e.g., Decimal("0.1") for 0.1 BTC); must be a valid lot size
+    inventory_threshold : dict[InstrumentId, Decimal]
+        Maximum position size per instrument before full skewing (e.g., 5.0 BTC)
+        At this size, skewing reaches its maximum (50% tightening)
     spread_pct : Decimal, default Decimal("0.01")
         Total bid-ask spread as decimal (0.01 = 1% total, 0.5% each side)
-    inventory_threshold : Decimal, default Decimal("5.0")
-        Maximum position size before full skewing (e.g., 5.0 BTC)
-        At this size, skewing reaches its maximum (50% tightening)
     quote_interval_seconds : int, default 30
         How often to refresh quotes in seconds
+    book_interval_ms : int, default 1000
+        How often to receive an order book snapshot in milliseconds
+        (should be a few times faster than the quote refresh)
     close_positions_on_stop : bool, default True
         Whether to close all positions when strategy stops
+    log_quotes : bool, default True
+        Whether to log position, skew and spread details on every refresh
+        (disable to skip formatting these messages at all)
 
     Examples
     --------
+    >>> btc = InstrumentId.from_str("BTC-USD.COINBASE")
     >>> config = MarketMakerConfig(
-    ...     instrument_id=InstrumentId.from_str("BTC-USD.COINBASE"),
-    ...     trade_size=Decimal("0.1"),
+    ...     instrument_ids=(btc,),
+    ...     trade_size={btc: Decimal("0.1")},
+    ...     inventory_threshold={btc: Decimal("5.0")},  # Max 5 BTC position
     ...     spread_pct=Decimal("0.01"),  # 1% total spread
-    ...     inventory_threshold=Decimal("5.0"),  # Max 5 BTC position
     ... )
     """
 
-    instrument_id: InstrumentId
-    trade_size: Decimal
+    instrument_ids: tuple[InstrumentId, ...]
+    trade_size: dict[InstrumentId, Decimal]
+    inventory_threshold: dict[InstrumentId, Decimal]
     spread_pct: Decimal = Decimal("0.01")
-    inventory_threshold: Decimal = Decimal("5.0")
     quote_interval_seconds: int = 30
+    book_interval_ms: int = 1000
     close_positions_on_stop: bool = True
+    log_quotes: bool = True
 
 
 # ==============================================================================
@@ -76,10 +98,13 @@ class MarketMaker(Strategy):
     Overview
     --------
     This strategy:
-    1. Places buy and sell orders around the market mid price
-    2. Refreshes quotes on a timer (not on every market update)
+    1. Places buy and sell orders around the market microprice
+    2. Refreshes quotes on a timer (not on every market update),
+       amending resting orders in place instead of cancel + resubmit
     3. Tightens one side when inventory builds up (risk management)
     4. Uses a simple linear formula for easy-to-understand skewing
+    5. Quotes any number of instruments from one timer, keeping
+       per-instrument state in dicts keyed by instrument ID
 
     Skewing Logic (SIMPLIFIED)
     ---------------------------
@@ -102,21 +127,81 @@ class MarketMaker(Strategy):
                                                    ↑ Tightened by 25%
     """
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access.
+    # Every attribute assigned on self must be listed here.
+    __slots__ = (
+        # Configuration
+        "instrument_ids",
+        "trade_size",
+        "spread_pct",
+        "inventory_threshold",
+        "quote_interval_seconds",
+        "book_interval_ms",
+        "close_positions_on_stop",
+        "log_quotes",
+        "_spread_pct_f",
+        "_half_spread_f",
+        "_inv_skew_scale",
+        # State (one entry per instrument)
+        "instruments",
+        "_mids",
+        "_tops",
+        "_signed_qty",
+        "_last_quotes",
+        "_price_precision",
+        "_qty",
+        "_tick_size",
+        "_tick_raw",
+    )
+
     def __init__(self, config: MarketMakerConfig) -> None:
         super().__init__(config)
 
+        # Sizes and thresholds are in each instrument's own base units,
+        # so every traded instrument needs its own values
+        for instrument_id in config.instrument_ids:
+            if instrument_id not in config.trade_size:
+                raise ValueError(f"No trade_size configured for {instrument_id}")
+            if instrument_id not in config.inventory_threshold:
+                raise ValueError(f"No inventory_threshold configured for {instrument_id}")
+
         # Store configuration
-        self.instrument_id = config.instrument_id
+        self.instrument_ids = config.instrument_ids
         self.trade_size = config.trade_size
         self.spread_pct = config.spread_pct
         self.inventory_threshold = config.inventory_threshold
         self.quote_interval_seconds = config.quote_interval_seconds
+        self.book_interval_ms = config.book_interval_ms
         self.close_positions_on_stop = config.close_positions_on_stop
-
-        # Initialize state
-        self.instrument: Instrument | None = None
-        self._book: OrderBook | None = None
-        self._current_mid: Decimal | None = None
+        self.log_quotes = config.log_quotes
+
+        # Float copies of the config used on the quoting hot path
+        # (Decimal math is much slower and prices get rounded anyway)
+        self._spread_pct_f = float(config.spread_pct)
+        self._half_spread_f = self._spread_pct_f / 2
+        # Skew per unit of position, per instrument: reaches the 50% cap at
+        # inventory_threshold (a zero threshold disables skewing)
+        self._inv_skew_scale: dict[InstrumentId, float] = {
+            instrument_id: 0.5 / float(threshold) if threshold else 0.0
+            for instrument_id, threshold in config.inventory_threshold.items()
+        }
+
+        # Initialize state, keyed by instrument ID
+        self.instruments: dict[InstrumentId, Instrument] = {}
+        self._mids: dict[InstrumentId, float] = {}  # Size-weighted microprice
+        self._tops: dict[InstrumentId, tuple] = {}  # Last (bid, ask, bid_size, ask_size)
+        # This strategy's own net position (drives the skew), kept up to date by position events
+        self._signed_qty: dict[InstrumentId, float] = {}
+
+        # Last (buy_ticks, sell_ticks, position) quoted, used to skip refreshes
+        # where nothing changed
+        self._last_quotes: dict[InstrumentId, tuple[int, int, float]] = {}
+
+        # Instrument-derived constants, set once in on_start
+        self._price_precision: dict[InstrumentId, int] = {}
+        self._qty: dict[InstrumentId, Quantity] = {}
+        self._tick_size: dict[InstrumentId, float] = {}
+        self._tick_raw: dict[InstrumentId, int] = {}  # Fixed-point raw value of one price tick
 
     # ==========================================================================
     # LIFECYCLE METHODS
@@ -124,27 +209,56 @@ class MarketMaker(Strategy):
 
     def on_start(self) -> None:
         """Initialize strategy when it starts."""
-        # Get instrument details
-        self.instrument = self.cache.instrument(self.instrument_id)
-        if self.instrument is None:
-            self.log.error(f"Could not find instrument {self.instrument_id}")
-            self.stop()
-            return
-
-        # Create order book to track market prices
-        self._book = OrderBook(
-            instrument_id=self.instrument.id,
-            book_type=BookType.L2_MBP,
-        )
-
-        # Subscribe to order book updates
-        self.subscribe_order_book_deltas(
-            instrument_id=self.instrument.id,
-            book_type=BookType.L2_MBP,
-            depth=50,
-        )
-
-        # Set up timer for periodic quote refresh
+        # Look up every instrument before subscribing to any, so a bad
+        # instrument stops the strategy without leaving others subscribed
+        for instrument_id in self.instrument_ids:
+            # Get instrument details
+            instrument = self.cache.instrument(instrument_id)
+            if instrument is None:
+                self.log.error(f"Could not find instrument {instrument_id}")
+                self.stop()
+                return
+
+            # Cache values used on every requote (Quantity is immutable)
+            try:
+                self._qty[instrument_id] = instrument.make_qty(self.trade_size[instrument_id])
+            except ValueError as e:
+                self.log.error(f"Invalid trade_size for {instrument_id}: {e}")
+                self.stop()
+                return
+
+            self.instruments[instrument_id] = instrument
+            self._price_precision[instrument_id] = instrument.price_precision
+            self._tick_size[instrument_id] = float(instrument.price_increment)
+            self._tick_raw[instrument_id] = instrument.price_increment.raw
+
+        for instrument_id in self.instrument_ids:
+            # Seed this strategy's own position; position events keep it current after
+            # this. Positions held by other strategies or EXTERNAL ones don't drive the
+            # skew, since we never get their events. Inventory found by reconciliation
+            # only counts if this strategy claims the instrument (external_order_claims)
+            positions = self.cache.positions_open(
+                instrument_id=instrument_id,
+                strategy_id=self.id,
+            )
+            self._signed_qty[instrument_id] = float(positions[0].signed_qty) if positions else 0.0
+
+            # Subscribe to periodic order book snapshots - we only need the
+            # microprice when the quote timer fires, not on every update
+            self.subscribe_order_book_at_interval(
+                instrument_id=instrument_id,
+                book_type=BookType.L2_MBP,
+                depth=50,  # Must be a depth the venue supports (Bybit LINEAR: 1, 50, 200, 500)
+                interval_ms=self.book_interval_ms,
+            )
+
+            self.log.info(
+                f"Quoting {instrument_id} | "
+                f"Size: {self._qty[instrument_id]} | "
+                f"Max Position: {self.inventory_threshold[instrument_id]}"
+            )
+
+        # Set up one timer for periodic quote refresh of all instruments
         self.clock.set_timer(
             name="quote_timer",
             interval=timedelta(seconds=self.quote_interval_seconds),
@@ -153,40 +267,98 @@ class MarketMaker(Strategy):
 
         self.log.info(
             f"Market Maker started | "
+            f"Instruments: {len(self.instrument_ids)} | "
             f"Spread: {self.spread_pct * 100:.2f}% | "
-            f"Max Position: {self.inventory_threshold} | "
             f"Refresh: {self.quote_interval_seconds}s"
         )
 
-    def on_order_book_deltas(self, deltas: OrderBookDeltas) -> None:
+    def on_order_book(self, order_book: OrderBook) -> None:
         """
-        Process order book updates.
+        Process order book snapshots.
         
-        Note: We only use this to track the mid price.
+        Note: We only use this to track the microprice.
         We don't requote here - that happens on the timer.
         """
-        if not self._book:
+        instrument_id = order_book.instrument_id
+        bid = order_book.best_bid_price()
+        ask = order_book.best_ask_price()
+        bid_size = order_book.best_bid_size()
+        ask_size = order_book.best_ask_size()
+
+        # Skip snapshots where top-of-book is unchanged
+        top = (bid, ask, bid_size, ask_size)
+        if top == self._tops.get(instrument_id):
             return
 
-        # Update our local order book
-        self._book.apply_deltas(deltas)
+        self._tops[instrument_id] = top
 
-        # Calculate current mid price
-        bid = self._book.best_bid_price()
-        ask = self._book.best_ask_price()
-        
-        self.log.info(f"Bid: {bid}, Ask: {ask}")
-        
-        if bid and ask:
-            self._current_mid = Decimal((bid + ask) / 2)
+        if not bid or not ask:
+            return
+
+        # Microprice: weight each side by the size resting on the *other* side,
+        # so the fair value leans towards the side with less liquidity
+        # S = (v_ask * bid + v_bid * ask) / (v_bid + v_ask)
+        v_bid = float(bid_size)
+        v_ask = float(ask_size)
+        total = v_bid + v_ask
+        if total > 0:
+            self._mids[instrument_id] = (v_ask * float(bid) + v_bid * float(ask)) / total
+        else:
+            self._mids[instrument_id] = (float(bid) + float(ask)) * 0.5
+
+    def on_position_opened(self, event: PositionOpened) -> None:
+        """Track the net position when one is opened."""
+        if event.instrument_id in self._signed_qty:
+            self._signed_qty[event.instrument_id] = float(event.signed_qty)
+
+    def on_position_changed(self, event: PositionChanged) -> None:
+        """Track the net position as fills change it."""
+        if event.instrument_id in self._signed_qty:
+            self._signed_qty[event.instrument_id] = float(event.signed_qty)
+
+    def on_position_closed(self, event: PositionClosed) -> None:
+        """Reset the net position once it is flat."""
+        if event.instrument_id in self._signed_qty:
+            self._signed_qty[event.instrument_id] = 0.0
+
+    def on_order_filled(self, event: OrderFilled) -> None:
+        """
+        A quote traded - requote on the next refresh.
+
+        Note: A buy and a sell filling in the same interval leave the position
+        unchanged, so the position alone can't tell us the quotes are gone.
+        """
+        self._last_quotes.pop(event.instrument_id, None)
+
+    def on_order_denied(self, event: OrderDenied) -> None:
+        """The risk engine denied a quote locally - requote on the next refresh."""
+        self._last_quotes.pop(event.instrument_id, None)
+
+    def on_order_canceled(self, event: OrderCanceled) -> None:
+        """A quote left the book - requote on the next refresh."""
+        self._last_quotes.pop(event.instrument_id, None)
+
+    def on_order_expired(self, event: OrderExpired) -> None:
+        """A quote left the book - requote on the next refresh."""
+        self._last_quotes.pop(event.instrument_id, None)
+
+    def on_order_rejected(self, event: OrderRejected) -> None:
+        """A quote never reached the book - requote on the next refresh."""
+        self._last_quotes.pop(event.instrument_id, None)
+
+    def on_order_modify_rejected(self, event: OrderModifyRejected) -> None:
+        """An amend failed - requote on the next refresh."""
+        self._last_quotes.pop(event.instrument_id, None)
 
     def on_stop(self) -> None:
         """Clean up when strategy stops."""
         self.clock.cancel_timer("quote_timer")
-        self.cancel_all_orders(self.instrument_id)
 
-        if self.close_positions_on_stop:
-            self.close_all_positions(self.instrument_id)
+        for instrument_id in self.instrument_ids:
+            self.cancel_all_orders(instrument_id)
+
+            if self.close_positions_on_stop:
+                self.close_all_positions(instrument_id)
 
         self.log.info("Market Maker stopped")
 
@@ -197,166 +369,227 @@ class MarketMaker(Strategy):
     def _on_quote_timer(self, event) -> None:
         """
         Called every X seconds by the timer.
-        This is where we refresh our quotes.
-        """
-        if not self._current_mid or not self.instrument:
-            self.log.warning("Cannot quote - no mid price available")
-            return
+        This is where we refresh our quotes for every instrument.
 
-        self.log.info("Refreshing quotes...")
+        Note: This must never block. Order commands (submit, modify, cancel)
+        are only queued here; the execution client sends them and handles
+        retries asynchronously, reporting back through order events.
+        """
+        if self.log_quotes:
+            self.log.info("Refreshing quotes...")
 
-        # Cancel old orders
-        self.cancel_all_orders(self.instrument_id)
+        mids = self._mids
+        for instrument_id in self.instrument_ids:
+            if instrument_id not in mids or instrument_id not in self.instruments:
+                self.log.warning(f"Cannot quote {instrument_id} - no mid price available")
+                continue
 
-        # Place new orders
-        self._place_orders()
+            # Amend (or place) orders
+            self._place_orders(instrument_id)
 
     # ==========================================================================
     # CORE LOGIC
     # ==========================================================================
 
-    def _place_orders(self) -> None:
+    def _place_orders(self, instrument_id: InstrumentId) -> None:
         """
-        Place buy and sell orders with simple linear skewing.
+        Place buy and sell orders for one instrument with simple linear skewing.
 
         Algorithm:
         1. Get current position
         2. Calculate skew percentage (0% to 50%)
         3. Apply skew to tighten one side
-        4. Place orders
+        4. Amend resting orders (or create new ones)
+        5. Send cancels and new orders as batches
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument to quote
         """
-        self.log.info("Placing orders...")
+        # Bind hot-path attributes to locals once (cheaper than repeated self.X lookups)
+        log = self.log
+        log_quotes = self.log_quotes
+        mid = self._mids[instrument_id]
+        half_spread = self._half_spread_f
+
+        if log_quotes:
+            log.info(f"Placing orders for {instrument_id}...")
 
         # Step 1: Get current position
-        position = self._get_position()
+        position = self._get_position(instrument_id)
 
         # Step 2: Calculate skew amount (as fraction of half-spread)
-        skew_fraction = self._calculate_skew(position)
-
-        # Step 3: Start with symmetric spreads
-        half_spread = self.spread_pct / Decimal(2)
-        bid_spread = half_spread
-        ask_spread = half_spread
-
-        # Apply skew by reducing one side
-        if position > 0:  # Long position → tighten ask to sell
-            reduction = half_spread * skew_fraction
-            ask_spread -= reduction
-            self.log.info(f"LONG {position} → Tightening ASK by {skew_fraction*100:.1f}%")
-        elif position < 0:  # Short position → tighten bid to buy
-            reduction = half_spread * skew_fraction
-            bid_spread -= reduction
-            self.log.info(f"SHORT {position} → Tightening BID by {skew_fraction*100:.1f}%")
+        # Linear in position size, capped at 50%:
+        #   2.5 BTC with a 5 BTC threshold → 25%, 5 BTC or more → 50%
+        skew_fraction = min(abs(position) * self._inv_skew_scale[instrument_id], 0.5)
+
+        # Step 3: Tighten one side by the skew, without branching on position:
+        # LONG → tighten ASK to sell, SHORT → tighten BID to buy, FLAT → no change
+        sign = (position > 0) - (position < 0)
+        reduction = half_spread * skew_fraction
+        ask_spread = half_spread - reduction * (sign > 0)
+        bid_spread = half_spread - reduction * (sign < 0)
+
+        if log_quotes and sign:
+            side = "LONG" if sign > 0 else "SHORT"
+            tightened = "ASK" if sign > 0 else "BID"
+            log.info(f"{side} {position} → Tightening {tightened} by {skew_fraction*100:.1f}%")
 
         # Safety check: spreads can't be negative
-        bid_spread = max(bid_spread, Decimal("0"))
-        ask_spread = max(ask_spread, Decimal("0"))
+        bid_spread = max(bid_spread, 0.0)
+        ask_spread = max(ask_spread, 0.0)
+
+        if log_quotes:
+            log.info(f"Final spreads → Bid: {bid_spread*100:.3f}%, Ask: {ask_spread*100:.3f}%")
+
+        # Step 4: Calculate final prices in whole ticks
+        # (round away from mid so the quoted spread is never tighter than intended)
+        mid_ticks = mid / self._tick_size[instrument_id]
+        buy_ticks = math.floor(mid_ticks * (1.0 - bid_spread))
+        sell_ticks = math.ceil(mid_ticks * (1.0 + ask_spread))
+
+        # Nothing moved since the last refresh - leave resting orders alone
+        # (fills, cancels, expiries, denials and rejects all reset the cache)
+        quote = (buy_ticks, sell_ticks, position)
+        if quote == self._last_quotes.get(instrument_id):
+            if log_quotes:
+                log.info("Quotes unchanged - skipping refresh")
+            return
+
+        # Step 5: Amend resting orders, or create new ones where a side has none
+        buy_orders = []
+        sell_orders = []
+        # Include orders sent but not yet acknowledged (SUBMITTED), which are
+        # in flight rather than open, so a slow ack doesn't cause a duplicate.
+        # Open orders go first so they are the ones amended on each side.
+        cache = self.cache
+        # Only this strategy's orders - never touch other strategies' or EXTERNAL ones.
+        strategy_id = self.id
+        orders = cache.orders_open(instrument_id=instrument_id, strategy_id=strategy_id) + [
+            order
+            for order in cache.orders_inflight(instrument_id=instrument_id, strategy_id=strategy_id)
+            if not order.is_open
+        ]
+        for order in orders:
+            if order.side == OrderSide.BUY:
+                buy_orders.append(order)
+            else:
+                sell_orders.append(order)
+
+        # Decide this before amending: modify_order itself puts an order in flight
+        in_flight = any(
+            order.is_inflight
+            for order in buy_orders[:1] + sell_orders[:1]
+        )
 
-        self.log.info(f"Final spreads → Bid: {bid_spread*100:.3f}%, Ask: {ask_spread*100:.3f}%")
+        new_orders = []
+        if not self._requote(instrument_id, buy_orders, buy_ticks):
+            new_orders.append(self._create_buy(instrument_id, buy_ticks))
+        if not self._requote(instrument_id, sell_orders, sell_ticks):
+            new_orders.append(self._create_sell(instrument_id, sell_ticks))
 
-        # Step 4: Calculate final prices
-        buy_price = self._current_mid * (Decimal(1) - bid_spread)
-        sell_price = self._current_mid * (Decimal(1) + ask_spread)
+        # Step 6: Send cancels and new orders as single batches
+        stale_orders = buy_orders[1:] + sell_orders[1:]
+        if stale_orders:
+            self.cancel_orders(stale_orders)
 
-        # Step 5: Submit orders
-        self._submit_buy(buy_price)
-        self._submit_sell(sell_price)
+        if len(new_orders) > 1:
+            self.submit_order_list(self.order_factory.create_list(new_orders))
+        elif new_orders:
+            self.submit_order(new_orders[0])
+
+        # Remember this quote, unless an order was in flight and so not requoted
+        if not in_flight:
+            self._last_quotes[instrument_id] = quote
 
     # ==========================================================================
-    # SKEW CALCULATION (SIMPLIFIED!)
+    # HELPER METHODS
     # ==========================================================================
 
-    def _calculate_skew(self, position: Decimal) -> Decimal:
+    def _get_position(self, instrument_id: InstrumentId) -> float:
         """
-        Calculate how much to tighten spreads based on position.
-        
-        Simple linear formula:
-        - At 0% of max → 0% tightening
-        - At 50% of max → 25% tightening  
-        - At 100% of max → 50% tightening (maximum)
-        
+        Get this strategy's current position (maintained from position events).
+
+        Only this strategy's positions count: those it opened, plus positions
+        found at startup for instruments listed in external_order_claims.
+        Positions held by other strategies or left EXTERNAL are not included.
+
         Parameters
         ----------
-        position : Decimal
-            Current signed position (positive=long, negative=short)
-            
+        instrument_id : InstrumentId
+            The instrument to look up
+
         Returns
         -------
-        Decimal
-            Fraction to tighten one side (0.0 to 0.5)
-            
-        Examples
-        --------
-        If position is 2.5 BTC and inventory_threshold is 5 BTC:
-        - ratio = 2.5 / 5 = 0.5 (50% of max)
-        - skew = 0.5 * 0.5 = 0.25 (tighten by 25%)
-        
-        If position is 5.0 BTC and inventory_threshold is 5 BTC:
-        - ratio = 5.0 / 5 = 1.0 (100% of max)
-        - skew = 1.0 * 0.5 = 0.5 (tighten by 50% - maximum!)
+        float
+            Signed position (positive=long, negative=short, 0=flat)
         """
-        if self.inventory_threshold == 0:
-            return Decimal(0)
-        
-        # How close are we to our max position?
-        position_ratio = abs(position) / self.inventory_threshold
-        
-        # Maximum tightening is 50% (half the spread goes to zero)
-        MAX_SKEW = Decimal("0.5")
-        
-        # Linear scaling: the closer to max position, the more we skew
-        skew_amount = position_ratio * MAX_SKEW
-        
-        # Cap at maximum (in case position exceeds our limit)
-        return min(skew_amount, MAX_SKEW)
-
-    # ==========================================================================
-    # HELPER METHODS
-    # ==========================================================================
+        return self._signed_qty.get(instrument_id, 0.0)
 
-    def _get_position(self) -> Decimal:
+    def _requote(self, instrument_id: InstrumentId, orders: list, ticks: int) -> bool:
         """
-        Get current position from cache.
+        Move the resting order for one side to a new price.
+
+        Orders already at the target price are left alone so they keep
+        their queue position.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument being quoted
+        orders : list
+            Open and in-flight orders for one side of the book
+            (only the first is amended)
+        ticks : int
+            Target price for that side, in whole ticks
 
         Returns
         -------
-        Decimal
-            Signed position (positive=long, negative=short, 0=flat)
+        bool
+            False if there was no resting order, so a new one must be submitted
         """
-        position = self.cache.positions_open(instrument_id=self.instrument_id)
-        if not position:
-            self.log.info("No position found")
-            return Decimal(0)
-
-        self.log.info(f"Positionnnn: {position[0]}")
-        qty = position[0].signed_qty.as_decimal()
-        self.log.info(f"Position: {qty}")
-        return qty
-
-    def _submit_buy(self, price: Decimal) -> None:
-        """Submit a buy limit order."""
-        self.log.info(f"Submitting buy order at {price}")
-        
-        if not self.instrument:
-            return
+        if not orders:
+            return False
 
-        order = self.order_factory.limit(
-            instrument_id=self.instrument_id,
-            order_side=OrderSide.BUY,
-            price=Price(price, precision=self.instrument.price_precision),
-            quantity=self.instrument.make_qty(self.trade_size),
+        order = orders[0]
+
+        # Still being submitted/amended/cancelled - wait for the venue to respond
+        if order.is_inflight:
+            return True
+
+        price = self._make_price(instrument_id, ticks)
+        if order.price == price:
+            return True
+
+        self.modify_order(order, price=price)
+        return True
+
+    def _make_price(self, instrument_id: InstrumentId, ticks: int) -> Price:
+        """Build a Price from whole ticks (exact, no float/string parsing)."""
+        return Price.from_raw(
+            ticks * self._tick_raw[instrument_id],
+            self._price_precision[instrument_id],
         )
-        self.submit_order(order)
 
-    def _submit_sell(self, price: Decimal) -> None:
-        """Submit a sell limit order."""
-        if not self.instrument:
-            return
+    def _create_buy(self, instrument_id: InstrumentId, ticks: int) -> LimitOrder:
+        """Create a buy limit order."""
+        price = self._make_price(instrument_id, ticks)
+        if self.log_quotes:
+            self.log.info(f"Creating buy order for {instrument_id} at {price}")
 
-        order = self.order_factory.limit(
-            instrument_id=self.instrument_id,
-            order_side=OrderSide.SELL,
-            price=Price(price, precision=self.instrument.price_precision),
-            quantity=self.instrument.make_qty(self.trade_size),
+        return self.order_factory.limit(
+            instrument_id=instrument_id,
+            order_side=OrderSide.BUY,
+            price=price,
+            quantity=self._qty[instrument_id],
         )
-        self.submit_order(order)
\ No newline at end of file
+
+    def _create_sell(self, instrument_id: InstrumentId, ticks: int) -> LimitOrder:
+        """Create a sell limit order."""
+        return self.order_factory.limit(
+            instrument_id=instrument_id,
+            order_side=OrderSide.SELL,
+            price=self._make_price(instrument_id, ticks),
+            quantity=self._qty[instrument_id],
+        )
\ No newline at end of file